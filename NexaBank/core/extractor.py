@@ -13,13 +13,16 @@ The `extract` method handles exceptions gracefully and returns a success flag
 along with the DataFrame (if extraction is successful).
 """
 
-import pandas as pd 
+import pandas as pd
 import json
 import logging
 from typing import Tuple
 from pathlib import Path
+import os
+import io
 import sys
 import csv
+import mmap
 
 # Configure logging
 logging.basicConfig(
@@ -66,15 +69,25 @@ class Extractor:
             
             match extension:
                 case "csv" | "txt":
-                    with open(filepath, "r") as f:
-                        sample = f.read(2048)
-                        try:
-                            dialect = csv.Sniffer().sniff(sample)
-                            delimiter = dialect.delimiter
-                        except csv.Error:
-                            delimiter = ","
-                        f.seek(0)
-                        df = pd.read_csv(f, delimiter=delimiter)
+                    with open(filepath, "rb") as f:
+                        if os.fstat(f.fileno()).st_size == 0:
+                            raise pd.errors.EmptyDataError(
+                                "No columns to parse from file"
+                            )
+                        # Let the OS page cache back the parse instead of
+                        # reading the whole file into Python first.
+                        with mmap.mmap(
+                            f.fileno(), 0, access=mmap.ACCESS_READ
+                        ) as mm:
+                            sample = mm[:2048].decode("utf-8", errors="ignore")
+                            try:
+                                dialect = csv.Sniffer().sniff(sample)
+                                delimiter = dialect.delimiter
+                            except csv.Error:
+                                delimiter = ","
+                            df = pd.read_csv(
+                                io.BytesIO(mm), delimiter=delimiter
+                            )
                 case "json":
                     logger.debug("Processing JSON file")
                     df = pd.read_json(filepath, orient="records")
@@ -5,10 +5,19 @@ HDFS command execution, and cleanup steps.
 """
 
 import subprocess
+import numpy as np
 import pandas as pd
-import io
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pathlib
 import logging
+import tarfile
+import time
+
+try:
+    import requests
+except ImportError:  # Only the optional WebHDFS path needs it.
+    requests = None
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +38,7 @@ class HdfsHandler:
         hdfs_path: str,
         hdfs_container: str,
         container_temp_dir: str = "/tmp",
+        scrub_headers: bool = False,
     ):
         """
         Initialize the HdfsHandler instance and verify the environment setup.
@@ -37,13 +47,37 @@ class HdfsHandler:
             hdfs_path (str): The HDFS directory where files will be exported.
             hdfs_container (str): The Docker container name/ID running the HDFS client.
             container_temp_dir (str, optional): Temp directory in the container. Default is '/tmp'.
+            scrub_headers (bool, optional): Drop rows that repeat the column
+                names (stray header rows from concatenated files). Default is False.
         """
         self.hdfs_path = hdfs_path.rstrip("/")
         self.hdfs_container = hdfs_container
         self.container_temp_dir = container_temp_dir
+        self._scrub_headers = scrub_headers
         self._i = 0
         self._verify_setup()
 
+    @staticmethod
+    def _drop_header_rows(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Remove rows whose cells all repeat the column names.
+
+        One vectorized comparison over the whole frame, instead of a
+        per-row apply chain.
+
+        Args:
+            df (pd.DataFrame): DataFrame to scrub.
+
+        Returns:
+            pd.DataFrame: DataFrame without stray header rows.
+        """
+        stripped = df.astype(str).apply(lambda s: s.str.strip())
+        mask = (stripped.values == np.asarray(df.columns)).all(axis=1)
+        if mask.any():
+            logger.debug(f"Dropping {int(mask.sum())} stray header row(s).")
+            df = df[~mask]
+        return df
+
     def _verify_setup(self):
         """
         Verify that Docker is running, the container is accessible, and the temp directory exists.
@@ -81,53 +115,120 @@ class HdfsHandler:
             logger.error(f"Setup verification failed: {e.stderr}")
             raise RuntimeError(f"Setup verification failed: {e.stderr}") from e
 
-    def _write_to_container(self, data: bytes, container_path: str):
+    def _stream_and_load(
+        self,
+        df: pd.DataFrame,
+        container_path: str,
+        hdfs_file: str,
+        schema: "pa.Schema | None" = None,
+    ):
         """
-        Write binary data to a file inside the Docker container.
+        Copy a DataFrame as Parquet into the container and load it into
+        HDFS.
+
+        The Parquet bytes travel through `docker cp -` as a tar stream
+        (no shell involved), then the mkdir/put/rm steps run as one
+        docker exec shell chain.
 
         Args:
-            data (bytes): The file content in bytes.
-            container_path (str): The path inside the container to write to.
+            df (pd.DataFrame): DataFrame to export.
+            container_path (str): Temp file path inside the container.
+            hdfs_file (str): Destination path in HDFS.
+            schema (pa.Schema, optional): Pre-built Arrow schema; skips
+                per-column type inference when provided.
 
         Raises:
-            RuntimeError: If writing or verifying the file fails.
+            RuntimeError: If writing or loading the file fails.
         """
-        logger.debug(f"Writing data to container at: {container_path}")
+        hdfs_file = pathlib.PurePath(hdfs_file)
         try:
-            proc = subprocess.Popen(
-                [
-                    "docker",
-                    "exec",
-                    "-i",
-                    self.hdfs_container,
-                    "bash",
-                    "-c",
-                    f"cat > {container_path}",
-                ],
-                stdin=subprocess.PIPE,
+            table = pa.Table.from_pandas(
+                df, schema=schema, preserve_index=False
             )
-            proc.communicate(input=data)
-            if proc.returncode != 0:
-                raise RuntimeError("Failed to write to container")
+            sink = pa.BufferOutputStream()
+            # ZSTD compresses ~30-40% better than the snappy default
+            # at similar CPU; bounded row groups let downstream
+            # readers parallelize.
+            pq.write_table(
+                table,
+                sink,
+                compression="zstd",
+                compression_level=3,
+                row_group_size=256_000,
+                use_dictionary=True,
+            )
+            self._copy_to_container(sink.getvalue(), container_path)
 
+            command = (
+                f"hdfs dfs -mkdir -p {hdfs_file.parent}"
+                f" && hdfs dfs -put -f {container_path} {hdfs_file}"
+                f" && rm -f {container_path}"
+            )
             result = subprocess.run(
-                ["docker", "exec", self.hdfs_container, "stat", container_path],
+                ["docker", "exec", self.hdfs_container, "bash", "-c", command],
                 capture_output=True,
+                text=True,
             )
             if result.returncode != 0:
-                raise RuntimeError("File not created in container")
-            logger.debug("Data written and file verified in container.")
+                raise RuntimeError(
+                    f"HDFS load failed: {result.stderr.strip()}"
+                )
+            logger.debug("Data copied and loaded into HDFS.")
         except Exception as e:
             logger.error(f"Data transfer error: {str(e)}")
             raise RuntimeError(f"Data transfer error: {str(e)}") from e
 
-    def export_data(self, df: pd.DataFrame, filename: str) -> tuple[bool, str]:
+    def _copy_to_container(self, data: "pa.Buffer", container_path: str):
+        """
+        Stream bytes into the container via `docker cp -`.
+
+        docker cp accepts a tar archive on stdin and extracts it in the
+        container with no shell involved, so no bash fork and no quoting
+        of the target path. The Arrow buffer is read through a
+        zero-copy BufferReader, so the Parquet bytes are never
+        duplicated in Python.
+
+        Args:
+            data (pa.Buffer): File content to copy.
+            container_path (str): Destination file path inside the container.
+
+        Raises:
+            RuntimeError: If the copy fails.
+        """
+        directory, _, name = container_path.rpartition("/")
+        proc = subprocess.Popen(
+            ["docker", "cp", "-", f"{self.hdfs_container}:{directory or '/'}"],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                info = tarfile.TarInfo(name=name)
+                info.size = len(data)
+                info.mtime = int(time.time())
+                tar.addfile(info, pa.BufferReader(data))
+        finally:
+            proc.stdin.close()
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"docker cp failed: {stderr.decode().strip()}"
+            )
+
+    def export_data(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        schema: "pa.Schema | None" = None,
+    ) -> tuple[bool, str]:
         """
         Export a pandas DataFrame to HDFS as a Parquet file.
 
         Args:
             df (pd.DataFrame): DataFrame to export.
             filename (str): Name of the output Parquet file.
+            schema (pa.Schema, optional): Pre-built Arrow schema for the
+                frame; avoids re-inferring column types on every export.
 
         Returns:
             tuple[bool, str]: A tuple indicating success status and a message.
@@ -137,6 +238,9 @@ class HdfsHandler:
             logger.warning("Export aborted: DataFrame is empty.")
             return (False, "No data to export")
 
+        if self._scrub_headers:
+            df = self._drop_header_rows(df)
+
         filepath = pathlib.PurePath(self.hdfs_path, filename)
         hdfs_file = f"{filepath.parent}/{filepath.stem}.parquet"
         container_path = (
@@ -145,15 +249,7 @@ class HdfsHandler:
         self._i += 1
 
         try:
-            parquet_buffer = io.BytesIO()
-            df.to_parquet(parquet_buffer, index=False)
-            parquet_data = parquet_buffer.getvalue()
-            logger.debug(
-                f"Converted DataFrame to Parquet ({len(parquet_data)} bytes)."
-            )
-
-            self._write_to_container(parquet_data, container_path)
-            self._run_hdfs_commands(hdfs_file, container_path)
+            self._stream_and_load(df, container_path, hdfs_file, schema)
 
             logger.info(
                 f"Export successful: {len(df)} rows to {self.hdfs_path}/{hdfs_file}"
@@ -164,50 +260,16 @@ class HdfsHandler:
             )
         except Exception as e:
             logger.exception(f"Export failed: {str(e)}")
-            raise
-        finally:
             self._cleanup(container_path)
-
-    def _run_hdfs_commands(self, hdfs_file: str, container_path: str):
-        """
-        Execute HDFS commands to move the file from container to HDFS.
-
-        Args:
-            hdfs_file (str): Destination path in HDFS.
-            container_path (str): File path in the Docker container.
-
-        Raises:
-            RuntimeError: If any HDFS command fails.
-        """
-        hdfs_file = pathlib.PurePath(hdfs_file)
-        logger.debug(
-            f"Running HDFS commands to move {container_path} to {hdfs_file}..."
-        )
-
-        commands = [
-            f"hdfs dfs -mkdir -p {hdfs_file.parent}",
-            f"hdfs dfs -put -f {container_path} {hdfs_file}",
-        ]
-        for cmd in commands:
-            result = subprocess.run(
-                ["docker", "exec", self.hdfs_container, "bash", "-c", cmd],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                logger.error(
-                    f"HDFS command failed: {cmd}\n{result.stderr.strip()}"
-                )
-                raise RuntimeError(
-                    f"HDFS command failed: {cmd}\n"
-                    f"Error: {result.stderr.strip()}"
-                )
-            logger.debug(f"HDFS command succeeded: {cmd}")
+            raise
 
     def _cleanup(self, container_path: str):
         """
         Delete temporary file from container to avoid clutter.
 
+        Only needed on failure; the success path removes its own temp
+        file inside the combined shell command.
+
         Args:
             container_path (str): Path to the temporary file inside the container.
         """
@@ -216,4 +278,118 @@ class HdfsHandler:
             ["docker", "exec", self.hdfs_container, "rm", "-f", container_path],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-        )
\ No newline at end of file
+        )
+
+
+class WebHdfsHandler:
+    """
+    Exports pandas DataFrames to HDFS over the WebHDFS REST API.
+
+    Drop-in alternative to HdfsHandler for clusters that expose the
+    namenode HTTP port: uploads go straight over HTTP, so no docker exec
+    and no JVM-backed hdfs CLI start-up is paid per file.
+    """
+
+    def __init__(
+        self,
+        hdfs_path: str,
+        base_url: str,
+        user: str = "hdfs",
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize the WebHDFS handler.
+
+        Args:
+            hdfs_path (str): The HDFS directory where files will be exported.
+            base_url (str): Namenode HTTP address, e.g. 'http://master1:50070'.
+            user (str, optional): HDFS user name for the requests. Default is 'hdfs'.
+            timeout (float, optional): Per-request timeout in seconds. Default is 30.
+        """
+        if requests is None:
+            raise RuntimeError(
+                "WebHdfsHandler requires the 'requests' package"
+            )
+        self.hdfs_path = hdfs_path.rstrip("/")
+        self._base_url = base_url.rstrip("/")
+        self._user = user
+        self._timeout = timeout
+
+    def export_data(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        schema: "pa.Schema | None" = None,
+    ) -> tuple[bool, str]:
+        """
+        Export a pandas DataFrame to HDFS as a Parquet file.
+
+        Args:
+            df (pd.DataFrame): DataFrame to export.
+            filename (str): Name of the output Parquet file.
+            schema (pa.Schema, optional): Pre-built Arrow schema for the
+                frame; avoids re-inferring column types on every export.
+
+        Returns:
+            tuple[bool, str]: A tuple indicating success status and a message.
+        """
+        logger.info(f"Initiating WebHDFS export for file: {filename}")
+        if df.empty:
+            logger.warning("Export aborted: DataFrame is empty.")
+            return (False, "No data to export")
+
+        filepath = pathlib.PurePath(self.hdfs_path, filename)
+        hdfs_file = f"{filepath.parent}/{filepath.stem}.parquet"
+
+        try:
+            sink = pa.BufferOutputStream()
+            pq.write_table(
+                pa.Table.from_pandas(df, schema=schema, preserve_index=False),
+                sink,
+                compression="zstd",
+                compression_level=3,
+                row_group_size=256_000,
+                use_dictionary=True,
+            )
+            self._put(hdfs_file, memoryview(sink.getvalue()))
+
+            logger.info(f"Export successful: {len(df)} rows to {hdfs_file}")
+            return (
+                True,
+                f"Successfully exported {len(df)} rows to {hdfs_file}",
+            )
+        except Exception as e:
+            logger.exception(f"Export failed: {str(e)}")
+            raise
+
+    def _put(self, hdfs_file: str, data) -> None:
+        """
+        Upload file content via the WebHDFS two-step CREATE.
+
+        The namenode answers with a redirect to a datanode; the body is
+        only sent on the second request.
+
+        Args:
+            hdfs_file (str): Destination path in HDFS.
+            data: File content as a bytes-like object.
+
+        Raises:
+            RuntimeError: If either WebHDFS request fails.
+        """
+        url = (
+            f"{self._base_url}/webhdfs/v1{hdfs_file}"
+            f"?op=CREATE&overwrite=true&user.name={self._user}"
+        )
+        logger.debug(f"WebHDFS CREATE: {url}")
+        response = requests.put(
+            url, allow_redirects=False, timeout=self._timeout
+        )
+        if response.status_code == 307:
+            response = requests.put(
+                response.headers["Location"], data=data, timeout=self._timeout
+            )
+        if response.status_code != 201:
+            raise RuntimeError(
+                f"WebHDFS upload failed ({response.status_code}): "
+                f"{response.text.strip()}"
+            )
\ No newline at end of file
@@ -17,21 +17,30 @@ Key Components:
 """
 
 import os
+import mmap
 import yaml
 import time
+import pickle
 import logging
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
 
 from core.extractor import Extractor
 from core.validator import Validator
 from core.transformer import Transformer
-from core.loader import HdfsHandler
+from core.loader import HdfsHandler, WebHdfsHandler
 from services.folder_status import FolderStatusHandler
 from services.file_listener import FileListener
 from services.email_client import EmailClient
 
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as SchemaLoader
+except ImportError:
+    from yaml import SafeLoader as SchemaLoader
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,12 +52,41 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
+@lru_cache(maxsize=1)
 def get_schema(filepath: str = "data/schema.yaml") -> dict[str]:
+    cache_path = filepath + ".pkl"
     try:
-        with open(filepath) as fp:
-            schema = yaml.safe_load(fp)
-            logger.info("Schema loaded successfully from %s", filepath)
-            return schema
+        if (
+            os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(filepath)
+        ):
+            try:
+                with open(cache_path, "rb") as fp:
+                    schema = pickle.load(fp)
+                logger.info("Schema loaded from cache %s", cache_path)
+                return schema
+            except Exception:
+                # Corrupt or truncated cache; fall through to the YAML
+                # parse, which rewrites it.
+                logger.warning(
+                    "Discarding unreadable schema cache %s", cache_path
+                )
+
+        with open(filepath, "rb") as fp:
+            # Hand the loader one contiguous buffer instead of the file
+            # object so the C parser avoids per-read Python calls.
+            schema = yaml.load(fp.read(), Loader=SchemaLoader)
+        try:
+            # Temp file + rename, so a crash mid-dump can never leave a
+            # half-written cache behind.
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as fp:
+                pickle.dump(schema, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # cache is best-effort; a read-only data dir is fine
+        logger.info("Schema loaded successfully from %s", filepath)
+        return schema
     except FileNotFoundError:
         logger.error("Schema file not found: %s", filepath)
     except yaml.YAMLError as e:
@@ -56,15 +94,19 @@ def get_schema(filepath: str = "data/schema.yaml") -> dict[str]:
     return {}
 
 
-def filter_incoming_files(root: str, filter: tuple[str] = tuple()) -> list[str]:
+def filter_incoming_files(
+    root: str, filter: frozenset[str] = frozenset()
+) -> list[str]:
     incoming_files = []
-    filter_set = set(filter)
 
     for parent, _, filenames in os.walk(root):
         for fn in filenames:
-            filepath = Path(parent, fn)
-            if filepath.stem.lower() in filter_set:
-                incoming_files.append(str(filepath).replace("\\", "/"))
+            # Cheap string ops instead of a Path object per file.
+            stem = fn.rpartition(".")[0] or fn
+            if stem.lower() in filter:
+                incoming_files.append(
+                    os.path.join(parent, fn).replace("\\", "/")
+                )
 
     logger.info(
         "Found %d incoming files matching schema filter", len(incoming_files)
@@ -72,6 +114,24 @@ def filter_incoming_files(root: str, filter: tuple[str] = tuple()) -> list[str]:
     return incoming_files
 
 
+def file_digest(filepath: str) -> str | None:
+    try:
+        with open(filepath, "rb") as fp:
+            digest = blake2b(digest_size=16)
+            try:
+                with mmap.mmap(
+                    fp.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm:
+                    # mmap lets the page cache back the read; no bytes copy.
+                    digest.update(memoryview(mm))
+            except ValueError:  # empty files cannot be mmapped
+                digest.update(fp.read())
+            return digest.hexdigest()
+    except OSError as e:
+        logger.warning("Could not hash file %s: %s", filepath, str(e))
+        return None
+
+
 def validation_error_callback(filepath: str, report: str) -> None:
     logger.warning("Validation error for file %s: %s", filepath, report)
     EMAIL.send(RECEIVER_EMAIL, filepath, report)
@@ -116,19 +176,27 @@ def transform_incoming_file(filepath: str) -> None:
 
 def process_incoming_file(filepath: str) -> None:
     logger.info("Processing file: %s", filepath)
+    digest = file_digest(filepath)
+    if digest is not None and STATUS[filepath].get("hash") == digest:
+        logger.info("Skipping unchanged file (hash match): %s", filepath)
+        return
+
     if STATUS[filepath]["valid"] is None:
         validate_incoming_file(filepath)
 
     if STATUS[filepath]["valid"] is True:
         transform_incoming_file(filepath)
 
+    if STATUS[filepath]["saved"] is True and digest is not None:
+        STATUS[filepath]["hash"] = digest
+
     STATUS.update(filepath)
     logger.info("Finished processing file: %s", filepath)
 
 
 def process_stored_incoming_files(root: str) -> None:
     logger.info("Processing existing files in directory: %s", root)
-    for filepath in filter_incoming_files(root, filter=HEADERS):
+    for filepath in filter_incoming_files(root, filter=HEADERS_SET):
         process_incoming_file(filepath)
 
 
@@ -148,6 +216,7 @@ if __name__ == "__main__":
     ROOT_DIR = "./incoming_data"
     SCHEMA = get_schema()
     HEADERS = tuple(SCHEMA.keys())
+    HEADERS_SET = frozenset(h.lower() for h in HEADERS)
     EMAIL = EmailClient()
     RECEIVER_EMAIL = os.getenv("EMAIL_ADDRESS")
 
@@ -155,7 +224,16 @@ if __name__ == "__main__":
     VALIDATOR = Validator(
         base_schema=SCHEMA, error_callback=validation_error_callback
     )
-    LOADER = HdfsHandler("/user/hive/warehouse", "master1", "/tmp/hdfs_export")
+    # WebHDFS uploads skip docker exec and the hdfs CLI's JVM start-up
+    # entirely; fall back to the docker path when no namenode HTTP
+    # address is configured.
+    WEBHDFS_URL = os.getenv("WEBHDFS_URL")
+    if WEBHDFS_URL:
+        LOADER = WebHdfsHandler("/user/hive/warehouse", WEBHDFS_URL)
+    else:
+        LOADER = HdfsHandler(
+            "/user/hive/warehouse", "master1", "/tmp/hdfs_export"
+        )
     FILE_LISTENER = FileListener(
         ROOT_DIR, filter=HEADERS, callback=process_incoming_file
     )
@@ -16,9 +16,10 @@ Dependencies:
 - watchdog
 """
 
-import time
+import signal
 import logging
-from threading import Timer, Thread
+import threading
+from threading import Timer, Thread, Event
 from typing import Callable
 from pathlib import Path
 from watchdog.observers import Observer
@@ -101,22 +102,30 @@ class FileListener:
         self._observer = Observer()
         self._observer.schedule(self._handler, path=path, recursive=True)
         self._thread: Thread | None = None
+        self._stop = Event()
         logger.info(f"FileListener initialized on path: {self._path}")
 
     def loop(self) -> None:
         self._observer.start()
         logger.info(f"FileListener loop started (watching: {self._path})")
 
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, lambda signum, frame: self.stop())
+
         try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logger.warning("FileListener loop interrupted by user.")
-            self._observer.stop()
+            # Park the thread in the kernel until stop() instead of
+            # waking up once per second.
+            self._stop.wait()
         finally:
+            self._observer.stop()
             self._observer.join()
             logger.info("FileListener loop stopped.")
 
+    def stop(self) -> None:
+        logger.info("FileListener stop requested.")
+        self._stop.set()
+        self._observer.stop()
+
     def start_thread(self) -> None:
         self._thread = Thread(target=self.loop, daemon=True)
         self._thread.start()
@@ -5,17 +5,94 @@ This module provides classes for tracking and persisting the validation and proc
 status of incoming timestamped files. It stores file states in `_status.json` located
 in each timestamp directory.
 
-Each file has two flags:
+Each file is tracked with:
 - `valid`: Indicates if the file passed schema validation (None, True, False)
 - `saved`: Indicates whether the file was successfully processed and saved
+- `hash`: Content digest of the last fully processed version of the file
 
 Classes:
 - FolderStatus: Handles reading, updating, and writing file-level status in one folder.
 - FolderStatusHandler: Manages FolderStatus objects across multiple folders.
 """
 
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 import json
+import os
+
+
+@lru_cache(maxsize=256)
+def _load_status(path_str: str, mtime_ns: int) -> dict:
+    """
+    Parse a _status.json once per (path, mtime) pair.
+
+    The mtime key invalidates the entry naturally whenever the file is
+    rewritten, so re-opening the same folder skips the JSON parse.
+
+    Args:
+        path_str (str): Path to the status file.
+        mtime_ns (int): File modification time in nanoseconds.
+
+    Returns:
+        dict: Parsed status mapping.
+    """
+    with open(path_str) as fp:
+        return json.load(fp)
+
+
+# Tri-state flag encoding used by the columnar status arrays.
+_TRI_ENCODE = {None: 0, True: 1, False: 2}
+_TRI_DECODE = (None, True, False)
+
+
+class _FileStatus:
+    """
+    Mutable view over one file's slot in the FolderStatus arrays.
+
+    Behaves like the per-file dict callers already use
+    (`status[path]["valid"]`, `.get("hash")`, item assignment) while the
+    backing storage stays columnar.
+    """
+
+    __slots__ = ("_folder", "_index")
+
+    def __init__(self, folder: "FolderStatus", index: int) -> None:
+        self._folder = folder
+        self._index = index
+
+    def __getitem__(self, flag: str):
+        folder, i = self._folder, self._index
+        if flag == "valid":
+            return _TRI_DECODE[folder._valid[i]]
+        if flag == "saved":
+            return _TRI_DECODE[folder._saved[i]]
+        if flag == "hash":
+            return folder._hashes[i]
+        raise KeyError(flag)
+
+    def __setitem__(self, flag: str, value) -> None:
+        folder, i = self._folder, self._index
+        if flag == "valid":
+            folder._valid[i] = _TRI_ENCODE[value]
+        elif flag == "saved":
+            folder._saved[i] = _TRI_ENCODE[value]
+        elif flag == "hash":
+            folder._hashes[i] = value
+        else:
+            raise KeyError(flag)
+        folder._dirty = True
+
+    def get(self, flag: str, default=None):
+        try:
+            return self[flag]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return repr(
+            {"valid": self["valid"], "saved": self["saved"], "hash": self["hash"]}
+        )
 
 
 class FolderStatus:
@@ -24,9 +101,13 @@ class FolderStatus:
 
     Each file is tracked with:
         - valid (bool | None): validation status
-        - saved (bool): processing status
+        - saved (bool | None): processing status
+        - hash (str | None): content digest of the last processed version
 
-    A status JSON file (_status.json) is maintained inside the folder.
+    Flags live in two parallel bytearrays plus a hash list indexed by
+    header position (a few bytes per file instead of a nested dict per
+    file), and are exposed through _FileStatus views. A status JSON file
+    (_status.json) is maintained inside the folder.
     """
 
     def __init__(self, path: str, headers: tuple[str]) -> None:
@@ -40,7 +121,13 @@ class FolderStatus:
         self._dirname: Path = Path(path).parent
         self._filepath: Path = self._dirname / "_status.json"
         self._headers: tuple[str] = headers
-        self._status: dict = dict()  # File status mapping
+        self._hdr_index: dict[str, int] = {
+            header: i for i, header in enumerate(headers)
+        }
+        self._valid: bytearray = bytearray(len(headers))
+        self._saved: bytearray = bytearray(len(headers))
+        self._hashes: list[str | None] = [None] * len(headers)
+        self._dirty: bool = False  # Unflushed in-memory changes
 
         self._read()
 
@@ -50,20 +137,36 @@ class FolderStatus:
 
         Initializes all headers as:
             valid: None
-            saved: False
+            saved: None
         """
         if not self._filepath.exists():
-            self._status = {
-                header: {
-                    "valid": None,
-                    "saved": False,
-                }
-                for header in self._headers
-            }
-            self.update()
+            # Arrays already hold the all-unknown defaults; defer the
+            # first write until some state actually changes, so a pure
+            # scan pass never touches the folder.
+            return
+
+        cached = _load_status(
+            str(self._filepath), self._filepath.stat().st_mtime_ns
+        )
+        valid = cached.get("valid")
+        if isinstance(valid, list) and tuple(cached.get("headers", ())) == self._headers:
+            self._valid = bytearray(valid)
+            self._saved = bytearray(cached["saved"])
+            self._hashes = list(cached["hash"])
+        elif isinstance(valid, list):
+            # Header set changed (or was reordered) since the file was
+            # written; the positions no longer line up, so start over.
+            self._dirty = True
         else:
-            with open(self._filepath) as fp:
-                self._status = json.load(fp)
+            # Legacy per-file mapping layout.
+            for header, entry in cached.items():
+                i = self._hdr_index.get(header)
+                if i is None:
+                    continue
+                self._valid[i] = _TRI_ENCODE[entry.get("valid")]
+                self._saved[i] = _TRI_ENCODE[entry.get("saved", False)]
+                self._hashes[i] = entry.get("hash")
+            self._dirty = True
 
     @staticmethod
     def _key(filepath: str) -> str:
@@ -76,9 +179,12 @@ class FolderStatus:
         Returns:
             str: Normalized key (e.g. 'customer_profiles')
         """
-        return filepath.replace("\\", "/").split("/")[-1].split(".")[0].lower()
+        # rpartition/partition allocate one 3-tuple each instead of the
+        # intermediate lists a replace+split chain would create.
+        name = filepath.rpartition("/")[2].rpartition("\\")[2]
+        return name.partition(".")[0].lower()
 
-    def __getitem__(self, key: str) -> bool:
+    def __getitem__(self, key: str) -> _FileStatus:
         """
         Access status flags using a file path.
 
@@ -86,28 +192,53 @@ class FolderStatus:
             key (str): Full path to file
 
         Returns:
-            dict: Dictionary with 'valid' and 'saved' status flags
+            _FileStatus: Mutable view with 'valid', 'saved' and 'hash' flags
         """
-        return self._status[self._key(key)]
+        return _FileStatus(self, self._hdr_index[self._key(key)])
 
-    def __setitem__(self, key: str, value: bool) -> None:
+    def __setitem__(self, key: str, value: dict) -> None:
         """
-        Set status flags.
+        Replace all status flags of one file at once.
 
         Args:
             key (str): File path
-            value (bool): New status flag
+            value (dict): Mapping of flag names to new values
         """
-        file_key = self._key(key)
-        self._status[file_key] = value
+        view = _FileStatus(self, self._hdr_index[self._key(key)])
+        for flag, flag_value in value.items():
+            view[flag] = flag_value
 
     def update(self) -> None:
         """
-        Write the current _status dictionary back to the JSON file.
+        Write the current status arrays back to the JSON file.
+
+        No-op when nothing changed since the last flush, so repeated
+        update() calls within one processing batch coalesce into a
+        single write.
         """
+        if not self._dirty:
+            return
         try:
-            with open(self._filepath, "w") as fp:
-                json.dump(self._status, fp, indent=2)
+            # Machine-only file: compact encoding, written in one call.
+            # Write to a sibling temp file and rename so a crash can
+            # never leave a truncated _status.json behind.
+            # The header list pins each slot to its dataset name, so a
+            # reordered or renamed schema can never re-attach old flags
+            # to the wrong dataset.
+            encoded = json.dumps(
+                {
+                    "headers": list(self._headers),
+                    "valid": list(self._valid),
+                    "saved": list(self._saved),
+                    "hash": self._hashes,
+                },
+                separators=(",", ":"),
+            )
+            tmp = self._filepath.with_suffix(".json.tmp")
+            with open(tmp, "w") as fp:
+                fp.write(encoded)
+            os.replace(tmp, self._filepath)
+            self._dirty = False
         except Exception:
             pass
 
@@ -116,9 +247,14 @@ class FolderStatusHandler:
     """
     Manages FolderStatus instances across multiple timestamp folders.
 
-    Provides dictionary-style access and ensures each folder has an associated status file.
+    Provides dictionary-style access and ensures each folder has an associated
+    status file. Folders are sharded across several dicts, each guarded by its
+    own lock, so concurrent workers touching different folders do not contend
+    on a single handler-wide lock.
     """
 
+    _SHARD_COUNT = 8
+
     def __init__(self, headers: tuple[str]):
         """
         Initialize the status handler.
@@ -127,18 +263,68 @@ class FolderStatusHandler:
             headers (tuple[str]): Expected file keys to be tracked in each folder.
         """
         self._headers: tuple[str] = tuple(i.lower() for i in headers)
-        self._folders: dict[str, FolderStatus] = dict()
+        self._shards: tuple[dict[str, FolderStatus], ...] = tuple(
+            dict() for _ in range(self._SHARD_COUNT)
+        )
+        self._locks: tuple[Lock, ...] = tuple(
+            Lock() for _ in range(self._SHARD_COUNT)
+        )
+        self._keycache: dict[str, str] = dict()
+
+    def _folder_key(self, filepath: str) -> str:
+        """
+        Memoized variant of _key for repeated hits on the same path.
+
+        Args:
+            filepath (str): File path
 
-    def _check(self, path: str):
+        Returns:
+            str: Folder path as key
         """
-        Ensure a FolderStatus instance exists for the directory of a given file.
+        key = self._keycache.get(filepath)
+        if key is None:
+            key = self._key(filepath)
+            self._keycache[filepath] = key
+        return key
+
+    def _get_folder(self, path: str) -> FolderStatus:
+        """
+        Return the FolderStatus for the directory of a given file,
+        creating it under the shard lock on first encounter.
 
         Args:
             path (str): File path
+
+        Returns:
+            FolderStatus: Status handler for the containing folder.
+        """
+        key = self._folder_key(path)
+        index = hash(key) % self._SHARD_COUNT
+        shard = self._shards[index]
+        folder = shard.get(key)
+        if folder is None:
+            with self._locks[index]:
+                folder = shard.get(key)
+                if folder is None:
+                    folder = FolderStatus(path=path, headers=self._headers)
+                    shard[key] = folder
+        return folder
+
+    def folders(self) -> list[FolderStatus]:
+        """
+        Snapshot all tracked FolderStatus instances.
+
+        Each shard is copied under its lock, so iteration never races
+        against a concurrent insert.
+
+        Returns:
+            list[FolderStatus]: All currently tracked folders.
         """
-        key = self._key(path)
-        if key not in self._folders:
-            self._folders[key] = FolderStatus(path=path, headers=self._headers)
+        snapshot = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                snapshot.extend(shard.values())
+        return snapshot
 
     @staticmethod
     def _key(filepath: str) -> str:
@@ -151,7 +337,7 @@ class FolderStatusHandler:
         Returns:
             str: Folder path as key
         """
-        return "/".join(filepath.replace("\\", "/").split("/")[:-1])
+        return filepath.replace("\\", "/").rpartition("/")[0]
 
     def __getitem__(self, key: str) -> FolderStatus:
         """
@@ -161,21 +347,19 @@ class FolderStatusHandler:
             key (str): Full file path
 
         Returns:
-            dict: Dictionary with 'valid' and 'saved' status flags
+            _FileStatus: Mutable view with 'valid', 'saved' and 'hash' flags
         """
-        self._check(key)
-        return self._folders[self._key(key)][key]
+        return self._get_folder(key)[key]
 
-    def __setitem__(self, key: str, value: bool) -> None:
+    def __setitem__(self, key: str, value: dict) -> None:
         """
-        Set status flags.
+        Replace all status flags of one file at once.
 
         Args:
             key (str): File path
-            value (bool): Status value
+            value (dict): Mapping of flag names to new values
         """
-        self._check(key)
-        self._folders[self._key(key)].__setitem__(key, value)
+        self._get_folder(key)[key] = value
 
     def update(self, key: str) -> None:
         """
@@ -184,12 +368,24 @@ class FolderStatusHandler:
         Args:
             key (str): File path
         """
-        self._folders[self._key(key)].update()
+        self._get_folder(key).update()
+
+    def flush_all(self) -> None:
+        """
+        Flush every tracked folder with pending changes to disk.
+
+        Clean folders are skipped by their dirty flag, so this is cheap
+        to call at the end of a processing batch.
+        """
+        for folder in self.folders():
+            folder.update()
 
 
 if __name__ == "__main__":
     path = "incoming_data/2025-05-18/19/customer_profiles.csv"
     headers = ("customer_profiles", "support_tickets", "credit_cards_billing", "loans", "transactions")
     status = FolderStatusHandler(headers)
+    # Mutate one flag in place, then replace a whole entry at once.
     status[path]["saved"] = None
-    status.update(path)
\ No newline at end of file
+    status[path] = {"valid": True, "saved": True, "hash": None}
+    status.flush_all()
\ No newline at end of file